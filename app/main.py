@@ -4,26 +4,41 @@ Odin's Eye - Main Application
 FastAPI-based AI service with web interface
 """
 
+import asyncio
+import grp
+import json
 import logging
 import os
+import shutil
 import subprocess
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 import psutil
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+try:
+    import pynvml
+except ImportError:  # NVML bindings are optional on non-GPU hosts
+    pynvml = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
-    title="Odin's Eye", description="Advanced AI/ML Platform", version="1.0.0"
+    title="Odin's Eye",
+    description="Advanced AI/ML Platform",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files
@@ -31,43 +46,559 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 # Templates
 templates = Jinja2Templates(directory="app/templates")
+# Pages rendered at startup, keyed by template name
+RENDERED_PAGES: Dict[str, str] = {}
+
+# External tools, resolved once so requests never walk PATH
+NVIDIA_SMI = shutil.which("nvidia-smi")
+DOCKER_BIN = shutil.which("docker")
+
+# The Docker daemon is queried over its UNIX socket instead of the CLI;
+# unversioned paths let the daemon answer with its own API version
+DOCKER_SOCKET = "/var/run/docker.sock"
+# Running containers are cached for a few seconds and invalidated early by
+# container events streamed from the daemon
+CONTAINER_CACHE_TTL_SECONDS = 5.0
+DOCKER_EVENTS_RETRY_SECONDS = 5.0
+# Only lifecycle events change the container list; exec events from
+# healthchecks would otherwise invalidate the cache every few seconds
+DOCKER_LIFECYCLE_EVENTS = [
+    "create",
+    "start",
+    "stop",
+    "die",
+    "destroy",
+    "rename",
+    "pause",
+    "unpause",
+    "health_status",
+]
+CONTAINER_CACHE: Dict[str, Any] = {
+    "containers": [],
+    "ts": 0.0,
+    "dirty": True,
+    "hits": 0,
+    "misses": 0,
+}
+
+# GPU telemetry is sampled in-process through NVML when available, falling
+# back to a long-lived `nvidia-smi -lms` reader, and served from memory so
+# API requests never query the driver themselves
+GPU_FIELDS = [
+    "index",
+    "name",
+    "memory.total",
+    "memory.used",
+    "memory.free",
+    "temperature.gpu",
+    "utilization.gpu",
+    "power.draw",
+    "power.limit",
+    "clocks.current.graphics",
+    "clocks.current.memory",
+]
+GPU_FIELD_TYPES = (int, str, int, int, int, int, int, float, float, int, int)
+# Each endpoint projects its historical response keys out of the shared
+# GPU_FIELDS sample: response key -> (GPU field, type)
+GpuProjection = Dict[str, Tuple[str, Callable[[Any], Any]]]
+GPU_INFO_PROJECTION: GpuProjection = {
+    "name": ("name", str),
+    "memory_total": ("memory.total", str),
+    "memory_used": ("memory.used", str),
+    "temperature": ("temperature.gpu", str),
+    "utilization": ("utilization.gpu", str),
+}
+GPU_DETAILED_PROJECTION: GpuProjection = {
+    "index": ("index", str),
+    "name": ("name", str),
+    "memory_total": ("memory.total", int),
+    "memory_used": ("memory.used", int),
+    "memory_free": ("memory.free", int),
+    "temperature": ("temperature.gpu", int),
+    "utilization": ("utilization.gpu", int),
+    "power_draw": ("power.draw", float),
+    "power_limit": ("power.limit", float),
+    "clock_graphics": ("clocks.current.graphics", int),
+    "clock_memory": ("clocks.current.memory", int),
+}
+GPU_REALTIME_PROJECTION: GpuProjection = {
+    "index": ("index", int),
+    "utilization": ("utilization.gpu", int),
+    "memory_used": ("memory.used", int),
+    "memory_total": ("memory.total", int),
+    "temperature": ("temperature.gpu", int),
+    "power_draw": ("power.draw", float),
+}
+GPU_PROCESS_QUERY_FIELDS = [
+    "gpu_uuid",
+    "pid",
+    "process_name",
+    "used_memory",
+    "process_type",
+]
+GPU_PROCESS_FIELD_TYPES = (str, str, str, int, str)
+# nvidia-smi prints N/A, or a bracketed placeholder such as [Not Supported]
+# or [GPU is lost], for values it cannot read
+NVIDIA_SMI_NA = "N/A"
+# Sampling cadence, tunable to trade freshness for CPU but floored so a
+# zero or tiny value cannot turn the samplers and streams into busy loops
+GPU_POLL_MS = max(100, int(os.getenv("GPU_POLL_INTERVAL_MS", "1000")))
+GPU_PROCESS_POLL_SECONDS = 2.0
+# An exited nvidia-smi reader is restarted with exponential backoff
+GPU_READER_RETRY_SECONDS = 1.0
+GPU_READER_MAX_RETRY_SECONDS = 30.0
+# A GPU whose sample is this old has stopped reporting, so it is no longer
+# served
+GPU_STALE_SECONDS = max(5 * GPU_POLL_MS / 1000, 2.0)
+
+# Latest sample per GPU index, keyed by nvidia-smi field name and typed per
+# GPU_FIELD_TYPES; counters the GPU does not report read as 0
+GPU_CACHE: Dict[int, Dict[str, Any]] = {}
+GPU_CACHE_TS = 0.0
+# When each GPU in GPU_CACHE was last sampled
+GPU_SAMPLE_TS: Dict[int, float] = {}
+# Per-GPU /api/gpu/realtime entries, indexed by GPU and updated in place by
+# the samplers so the endpoint serves them without building new dicts
+GPU_REALTIME_BUFFERS: List[Dict[str, Any]] = []
+# Latest compute-apps rows; None until the driver has answered successfully
+GPU_PROCESS_CACHE: Optional[List[List[Any]]] = None
+
+# System info is cached briefly so concurrent dashboard hits share a sample,
+# and CPU usage is sampled in the background instead of on the request path
+SYSTEM_INFO_TTL_SECONDS = 1.0
+SYS_POLL_S = max(0.5, float(os.getenv("SYS_POLL_INTERVAL_S", "2")))
+CPU_PERCENT = 0.0
+_SI_CACHE: Dict[str, Any] = {"data": None, "ts": 0.0}
+
+_gpu_reader: Optional[asyncio.subprocess.Process] = None
+_nvml_active = False
+_docker_client: Optional[httpx.AsyncClient] = None
+_background_tasks: List["asyncio.Task[None]"] = []
+
+
+async def _run(
+    cmd: List[str], timeout: float = 5
+) -> "subprocess.CompletedProcess[str]":
+    """Run a command without blocking the event loop"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(
+        cmd,
+        await proc.wait(),
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+def gpu_monitoring_available() -> bool:
+    """Whether any GPU telemetry source exists on this host"""
+    return _nvml_active or NVIDIA_SMI is not None
+
+
+def gpu_reader_running() -> bool:
+    """Whether a GPU sampler is alive"""
+    if _nvml_active:
+        return True
+    return _gpu_reader is not None and _gpu_reader.returncode is None
+
+
+def live_gpu_samples() -> List[Dict[str, Any]]:
+    """Cached samples of the GPUs that are still being refreshed"""
+    cutoff = time.time() - GPU_STALE_SECONDS
+    return [
+        sample
+        for index, sample in GPU_CACHE.items()
+        if GPU_SAMPLE_TS.get(index, 0.0) >= cutoff
+    ]
+
+
+def project_gpu(sample: Dict[str, Any], projection: GpuProjection) -> Dict[str, Any]:
+    """Build one endpoint's view of a GPU sample"""
+    return {key: cast(sample[field]) for key, (field, cast) in projection.items()}
+
+
+def _memory_percent(used: int, total: int) -> float:
+    """Percentage of GPU memory in use, rounded for display"""
+    if not total:
+        return 0.0
+    return round((used / total) * 100, 1)
+
+
+def _store_gpu_sample(sample: Dict[str, Any], sampled_at: float) -> None:
+    """Cache a GPU's new sample and refresh its realtime buffer"""
+    global GPU_CACHE_TS
+    GPU_CACHE[sample["index"]] = sample
+    GPU_SAMPLE_TS[sample["index"]] = sampled_at
+    GPU_CACHE_TS = sampled_at
+    _publish_realtime(sample, sampled_at)
+
+
+def _publish_realtime(sample: Dict[str, Any], sampled_at: float) -> None:
+    """Refresh a GPU's realtime buffer in place from a new sample"""
+    index = sample["index"]
+    while len(GPU_REALTIME_BUFFERS) <= index:
+        GPU_REALTIME_BUFFERS.append({})
+    buf = GPU_REALTIME_BUFFERS[index]
+    for key, (field, cast) in GPU_REALTIME_PROJECTION.items():
+        buf[key] = cast(sample[field])
+    buf["memory_percent"] = _memory_percent(buf["memory_used"], buf["memory_total"])
+    buf["timestamp"] = sampled_at
+
+
+def _smi_missing(value: str) -> bool:
+    """Whether an nvidia-smi field holds a placeholder instead of a value"""
+    return value == NVIDIA_SMI_NA or value.startswith("[")
+
+
+def _parse_csv_row(line: str, types: Tuple[type, ...]) -> List[Any]:
+    """Split one nvidia-smi CSV row and type its fields; numeric "N/A" reads as 0"""
+    return [
+        value if cast is str else cast(value) if not _smi_missing(value) else 0
+        for cast, value in zip(types, line.split(", "))
+    ]
+
+
+def _nvml_value(query: Any, *args: Any, default: Any = 0) -> Any:
+    """Call an NVML query, mapping unsupported values to a default"""
+    try:
+        return query(*args)
+    except pynvml.NVMLError:
+        return default
+
+
+def _sample_nvml_stats() -> None:
+    """Read every GPU's counters through NVML into GPU_CACHE"""
+    sampled = set()
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        # A GPU that cannot be read must not blank out the others
+        try:
+            _store_gpu_sample(_sample_nvml_device(i), time.time())
+            sampled.add(i)
+        except pynvml.NVMLError as e:
+            logger.error(f"Error sampling GPU {i} through NVML: {e}")
+    # Drop GPUs this sweep could not read instead of serving their last sample
+    for index in GPU_CACHE.keys() - sampled:
+        del GPU_CACHE[index]
+        GPU_SAMPLE_TS.pop(index, None)
+
+
+def _sample_nvml_device(i: int) -> Dict[str, Any]:
+    """Read one GPU's counters through NVML, keyed like GPU_FIELDS"""
+    mib = 1024 * 1024
+    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+    name = pynvml.nvmlDeviceGetName(handle)
+    mem = _nvml_value(pynvml.nvmlDeviceGetMemoryInfo, handle, default=None)
+    # MIG-enabled GPUs report utilization as not supported
+    util = _nvml_value(pynvml.nvmlDeviceGetUtilizationRates, handle, default=None)
+    power_draw = _nvml_value(pynvml.nvmlDeviceGetPowerUsage, handle)
+    power_limit = _nvml_value(pynvml.nvmlDeviceGetEnforcedPowerLimit, handle)
+    return {
+        "index": i,
+        "name": name.decode() if isinstance(name, bytes) else name,
+        "memory.total": mem.total // mib if mem else 0,
+        "memory.used": mem.used // mib if mem else 0,
+        "memory.free": mem.free // mib if mem else 0,
+        "temperature.gpu": _nvml_value(
+            pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU
+        ),
+        "utilization.gpu": util.gpu if util else 0,
+        "power.draw": power_draw / 1000,
+        "power.limit": power_limit / 1000,
+        "clocks.current.graphics": _nvml_value(
+            pynvml.nvmlDeviceGetClockInfo, handle, pynvml.NVML_CLOCK_GRAPHICS
+        ),
+        "clocks.current.memory": _nvml_value(
+            pynvml.nvmlDeviceGetClockInfo, handle, pynvml.NVML_CLOCK_MEM
+        ),
+    }
+
+
+def _sample_nvml_processes() -> List[List[Any]]:
+    """List compute processes on every GPU through NVML"""
+    rows: List[List[Any]] = []
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        # A lost GPU, or one that cannot list processes, must not hide the
+        # processes on the others; this repeats every poll, so log quietly
+        try:
+            rows.extend(_sample_nvml_device_processes(i))
+        except pynvml.NVMLError as e:
+            logger.debug(f"Error listing processes on GPU {i} through NVML: {e}")
+    return rows
+
+
+def _sample_nvml_device_processes(i: int) -> List[List[Any]]:
+    """List one GPU's compute processes through NVML as compute-apps rows"""
+    mib = 1024 * 1024
+    rows: List[List[Any]] = []
+    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+    uuid = pynvml.nvmlDeviceGetUUID(handle)
+    for proc in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+        name = _nvml_value(pynvml.nvmlSystemGetProcessName, proc.pid, default="N/A")
+        rows.append(
+            [
+                uuid.decode() if isinstance(uuid, bytes) else uuid,
+                str(proc.pid),
+                name.decode() if isinstance(name, bytes) else name,
+                (proc.usedGpuMemory or 0) // mib,
+                "C",
+            ]
+        )
+    return rows
+
+
+async def _poll_nvml_stats() -> None:
+    """Refresh GPU_CACHE from NVML every GPU_POLL_MS"""
+    while True:
+        try:
+            _sample_nvml_stats()
+        except Exception as e:
+            logger.error(f"Error sampling GPU stats through NVML: {e}")
+        await asyncio.sleep(GPU_POLL_MS / 1000)
+
+
+async def _poll_nvml_processes() -> None:
+    """Refresh GPU_PROCESS_CACHE from NVML on a slower cadence"""
+    global GPU_PROCESS_CACHE
+    while True:
+        try:
+            GPU_PROCESS_CACHE = _sample_nvml_processes()
+        except Exception as e:
+            logger.error(f"Error listing GPU processes through NVML: {e}")
+            GPU_PROCESS_CACHE = None
+        await asyncio.sleep(GPU_PROCESS_POLL_SECONDS)
+
+
+async def _read_gpu_stats(proc: asyncio.subprocess.Process) -> None:
+    """Consume `nvidia-smi -lms` output into GPU_CACHE"""
+    assert proc.stdout is not None
+    async for raw_line in proc.stdout:
+        line = raw_line.decode("ascii", "replace").rstrip()
+        # A row without a readable index cannot be attributed to a GPU
+        if _smi_missing(line.split(", ", 1)[0]):
+            continue
+        try:
+            row = _parse_csv_row(line, GPU_FIELD_TYPES)
+        except ValueError:
+            continue
+        if len(row) != len(GPU_FIELDS):
+            continue
+        # One bad sample must not stop the reader, or the pipe stops draining
+        try:
+            _store_gpu_sample(dict(zip(GPU_FIELDS, row)), time.time())
+        except Exception as e:
+            logger.error(f"Error publishing nvidia-smi GPU sample: {e}")
+
+
+async def _log_gpu_reader_errors(proc: asyncio.subprocess.Process) -> None:
+    """Log what the nvidia-smi reader writes to stderr, such as why it exited"""
+    assert proc.stderr is not None
+    async for raw_line in proc.stderr:
+        logger.warning(f"nvidia-smi: {raw_line.decode(errors='replace').rstrip()}")
+
+
+async def _run_gpu_reader() -> None:
+    """Keep an `nvidia-smi -lms` reader running, restarting it when it exits"""
+    global _gpu_reader
+    assert NVIDIA_SMI is not None
+    retry = GPU_READER_RETRY_SECONDS
+    while True:
+        started = time.monotonic()
+        try:
+            _gpu_reader = await asyncio.create_subprocess_exec(
+                NVIDIA_SMI,
+                "--query-gpu=" + ",".join(GPU_FIELDS),
+                "--format=csv,noheader,nounits",
+                "-lms",
+                str(GPU_POLL_MS),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            logger.error(f"Cannot start nvidia-smi GPU reader: {e}")
+        else:
+            await asyncio.gather(
+                _read_gpu_stats(_gpu_reader), _log_gpu_reader_errors(_gpu_reader)
+            )
+            code = await _gpu_reader.wait()
+            logger.warning(f"nvidia-smi GPU reader exited with code {code}")
+        # A reader that ran for a while starts over from the shortest delay
+        if time.monotonic() - started > GPU_READER_MAX_RETRY_SECONDS:
+            retry = GPU_READER_RETRY_SECONDS
+        await asyncio.sleep(retry)
+        retry = min(retry * 2, GPU_READER_MAX_RETRY_SECONDS)
+
+
+async def _poll_gpu_processes() -> None:
+    """Refresh GPU_PROCESS_CACHE on a slower cadence than GPU stats"""
+    global GPU_PROCESS_CACHE
+    assert NVIDIA_SMI is not None
+    while True:
+        try:
+            result = await _run(
+                [
+                    NVIDIA_SMI,
+                    "--query-compute-apps=" + ",".join(GPU_PROCESS_QUERY_FIELDS),
+                    "--format=csv,noheader,nounits",
+                ]
+            )
+            if result.returncode == 0:
+                GPU_PROCESS_CACHE = [
+                    _parse_csv_row(line, GPU_PROCESS_FIELD_TYPES)
+                    for line in result.stdout.splitlines()
+                    if line.strip()
+                ]
+            else:
+                GPU_PROCESS_CACHE = None
+        except subprocess.TimeoutExpired:
+            GPU_PROCESS_CACHE = None
+        except FileNotFoundError:
+            GPU_PROCESS_CACHE = None
+            return
+        except Exception as e:
+            logger.error(f"Error polling GPU processes: {e}")
+        await asyncio.sleep(GPU_PROCESS_POLL_SECONDS)
+
+
+async def _sample_cpu() -> None:
+    """Keep CPU_PERCENT current without blocking requests"""
+    global CPU_PERCENT
+    # The first non-blocking call only primes psutil's counters
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(SYS_POLL_S)
+        CPU_PERCENT = psutil.cpu_percent(interval=None)
+
+
+async def _watch_container_events() -> None:
+    """Mark CONTAINER_CACHE dirty whenever a container changes state"""
+    params = {
+        "filters": json.dumps({"type": ["container"], "event": DOCKER_LIFECYCLE_EVENTS})
+    }
+    while True:
+        try:
+            assert _docker_client is not None
+            async with _docker_client.stream(
+                "GET", "/events", params=params, timeout=None
+            ) as response:
+                async for _ in response.aiter_lines():
+                    CONTAINER_CACHE["dirty"] = True
+        except httpx.HTTPError as e:
+            logger.debug(f"Docker event stream unavailable: {e}")
+        # Events may have been missed while the stream was down
+        CONTAINER_CACHE["dirty"] = True
+        await asyncio.sleep(DOCKER_EVENTS_RETRY_SECONDS)
+
+
+@app.on_event("startup")  # type: ignore[misc]
+async def start_system_sampler() -> None:
+    """Launch the background CPU sampler"""
+    _background_tasks.append(asyncio.create_task(_sample_cpu()))
+
+
+@app.on_event("startup")  # type: ignore[misc]
+async def start_gpu_readers() -> None:
+    """Launch the background GPU samplers, preferring NVML over nvidia-smi"""
+    global _nvml_active
+    if pynvml is not None:
+        try:
+            pynvml.nvmlInit()
+        except pynvml.NVMLError as e:
+            logger.info(f"NVML unavailable ({e}), falling back to nvidia-smi")
+        else:
+            _nvml_active = True
+            _background_tasks.append(asyncio.create_task(_poll_nvml_stats()))
+            _background_tasks.append(asyncio.create_task(_poll_nvml_processes()))
+            return
+    if NVIDIA_SMI is None:
+        logger.info("nvidia-smi not found, GPU monitoring disabled")
+        return
+    _background_tasks.append(asyncio.create_task(_run_gpu_reader()))
+    _background_tasks.append(asyncio.create_task(_poll_gpu_processes()))
+
+
+@app.on_event("startup")  # type: ignore[misc]
+async def start_docker_client() -> None:
+    """Open the shared HTTP client for the Docker socket"""
+    global _docker_client
+    _docker_client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(uds=DOCKER_SOCKET),
+        base_url="http://docker",
+        timeout=5,
+    )
+    _background_tasks.append(asyncio.create_task(_watch_container_events()))
+
+
+@app.on_event("shutdown")  # type: ignore[misc]
+async def stop_background_tasks() -> None:
+    """Stop the background samplers and the nvidia-smi reader"""
+    global _nvml_active
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    if _nvml_active:
+        pynvml.nvmlShutdown()
+        _nvml_active = False
+    if gpu_reader_running():
+        assert _gpu_reader is not None
+        _gpu_reader.terminate()
+        await _gpu_reader.wait()
+
+
+@app.on_event("shutdown")  # type: ignore[misc]
+async def close_docker_client() -> None:
+    """Close the shared HTTP client for the Docker socket"""
+    global _docker_client
+    if _docker_client is not None:
+        await _docker_client.aclose()
+        _docker_client = None
 
 
 # System information
-def get_system_info() -> dict[str, Any]:
-    """Get system information"""
+async def get_system_info() -> dict[str, Any]:
+    """Get system information, reusing a sample younger than the TTL"""
+    if time.monotonic() - _SI_CACHE["ts"] < SYSTEM_INFO_TTL_SECONDS:
+        return _SI_CACHE["data"]  # type: ignore[no-any-return]
+    # Collection never awaits, so concurrent requests cannot interleave here
+    system_info = _collect_system_info()
+    if "error" not in system_info:
+        _SI_CACHE["data"] = system_info
+        _SI_CACHE["ts"] = time.monotonic()
+    return system_info
+
+
+def _collect_system_info() -> dict[str, Any]:
+    """Sample system information"""
     try:
         # CPU info
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = CPU_PERCENT
         cpu_count = psutil.cpu_count()
 
         # Memory info
         memory = psutil.virtual_memory()
 
-        # Disk info
-        disk = psutil.disk_usage("/")
+        # Disk info, straight from statvfs
+        disk = os.statvfs("/")
 
         # GPU info (if available)
         gpu_info = "Not available"
-        try:
-            result = subprocess.run(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=name,memory.total,memory.used",
-                    "--format=csv,noheader,nounits",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
+        gpu_samples = live_gpu_samples()
+        if gpu_samples:
+            gpu_info = "\n".join(
+                f"{gpu['name']}, {gpu['memory.total']}, {gpu['memory.used']}"
+                for gpu in gpu_samples
             )
-            if result.returncode == 0:
-                gpu_info = result.stdout.strip()
-        except (
-            subprocess.TimeoutExpired,
-            FileNotFoundError,
-            subprocess.CalledProcessError,
-        ):
-            pass
 
         return {
             "cpu_percent": cpu_percent,
@@ -75,9 +606,9 @@ def get_system_info() -> dict[str, Any]:
             "memory_total": memory.total,
             "memory_used": memory.used,
             "memory_percent": memory.percent,
-            "disk_total": disk.total,
-            "disk_used": disk.used,
-            "disk_percent": (disk.used / disk.total) * 100,
+            "disk_total": disk.f_blocks * disk.f_frsize,
+            "disk_used": (disk.f_blocks - disk.f_bfree) * disk.f_frsize,
+            "disk_percent": 100.0 - 100.0 * disk.f_bfree / disk.f_blocks,
             "gpu_info": gpu_info,
             "timestamp": datetime.now().isoformat(),
         }
@@ -86,25 +617,29 @@ def get_system_info() -> dict[str, Any]:
         return {"error": str(e)}
 
 
+@app.on_event("startup")  # type: ignore[misc]
+async def render_pages() -> None:
+    """Render the HTML pages once; they load their data client-side"""
+    for name in ("dashboard.html", "gpu-monitor.html"):
+        RENDERED_PAGES[name] = templates.get_template(name).render()
+
+
 @app.get("/", response_class=HTMLResponse)  # type: ignore[misc]
-async def root(request: Request) -> Any:
+async def root() -> Any:
     """Main dashboard page"""
-    system_info = get_system_info()
-    return templates.TemplateResponse(
-        "dashboard.html", {"request": request, "system_info": system_info}
-    )
+    return HTMLResponse(RENDERED_PAGES["dashboard.html"])
 
 
 @app.get("/gpu", response_class=HTMLResponse)  # type: ignore[misc]
-async def gpu_monitor(request: Request) -> Any:
+async def gpu_monitor() -> Any:
     """GPU monitoring page"""
-    return templates.TemplateResponse("gpu-monitor.html", {"request": request})
+    return HTMLResponse(RENDERED_PAGES["gpu-monitor.html"])
 
 
 @app.get("/api/status")  # type: ignore[misc]
 async def status() -> dict[str, Any]:
     """API endpoint for system status"""
-    return get_system_info()
+    return await get_system_info()
 
 
 @app.get("/api/health")  # type: ignore[misc]
@@ -113,9 +648,33 @@ async def health() -> dict[str, Any]:
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+def _format_ports(ports: List[Dict[str, Any]]) -> str:
+    """Render Docker API port bindings the way `docker ps` shows them"""
+    rendered = []
+    for port in ports:
+        if "PublicPort" in port:
+            rendered.append(
+                f"{port.get('IP', '')}:{port['PublicPort']}"
+                f"->{port['PrivatePort']}/{port['Type']}"
+            )
+        else:
+            rendered.append(f"{port['PrivatePort']}/{port['Type']}")
+    return ", ".join(rendered)
+
+
+def _summarize_container(container: Dict[str, Any]) -> Dict[str, str]:
+    """Reduce a Docker API container object to name, status and ports"""
+    return {
+        "name": container["Names"][0].lstrip("/"),
+        "status": container["Status"],
+        "ports": _format_ports(container.get("Ports", [])),
+    }
+
+
 @app.get("/api/services")  # type: ignore[misc]
 async def services() -> dict[str, Any]:
     """Get running services status"""
+    timestamp = datetime.now().isoformat()
     try:
         # Check if Docker is running and get container info
         docker_status = "unknown"
@@ -124,59 +683,56 @@ async def services() -> dict[str, Any]:
 
         try:
             # Check if Docker socket exists
-            if not os.path.exists("/var/run/docker.sock"):
+            if not os.path.exists(DOCKER_SOCKET):
                 docker_status = "socket not found"
-                error_details.append("Docker socket /var/run/docker.sock not found")
+                error_details.append(f"Docker socket {DOCKER_SOCKET} not found")
                 return {
                     "docker": docker_status,
                     "containers": containers,
                     "error_details": error_details,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                 }
 
-            # Check if docker command is available
-            result = subprocess.run(["which", "docker"], capture_output=True, text=True)
-            if result.returncode != 0:
-                docker_status = "docker command not found"
-                error_details.append("Docker command not found in PATH")
+            # Serve the cached container list while it is fresh and clean
+            if (
+                not CONTAINER_CACHE["dirty"]
+                and time.monotonic() - CONTAINER_CACHE["ts"]
+                < CONTAINER_CACHE_TTL_SECONDS
+            ):
+                CONTAINER_CACHE["hits"] += 1
                 return {
-                    "docker": docker_status,
-                    "containers": containers,
+                    "docker": "running",
+                    "containers": CONTAINER_CACHE["containers"],
                     "error_details": error_details,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                 }
+            CONTAINER_CACHE["misses"] += 1
+            # Invalidate up front so a failed request or an event arriving
+            # mid-request is not masked by the previous list
+            CONTAINER_CACHE["dirty"] = False
+            CONTAINER_CACHE["ts"] = 0.0
 
-            # Check if Docker is available
-            result = subprocess.run(
-                ["docker", "ps", "--format", "{{.Names}},{{.Status}},{{.Ports}}"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            # Ask the daemon for running containers
+            assert _docker_client is not None
+            response = await _docker_client.get("/containers/json")
 
-            if result.returncode == 0:
+            if response.status_code == 200:
                 docker_status = "running"
-                # Parse container information
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        parts = line.split(",", 2)
-                        if len(parts) >= 3:
-                            containers.append(
-                                {
-                                    "name": parts[0],
-                                    "status": parts[1],
-                                    "ports": parts[2] if len(parts) > 2 else "",
-                                }
-                            )
+                for container in response.json():
+                    containers.append(_summarize_container(container))
+                CONTAINER_CACHE["containers"] = containers
+                CONTAINER_CACHE["ts"] = time.monotonic()
             else:
                 docker_status = "not running"
-                error_details.append(f"Docker ps failed: {result.stderr.strip()}")
-        except FileNotFoundError:
-            docker_status = "not available"
-            error_details.append("Docker command not found")
-        except subprocess.TimeoutExpired:
+                error_details.append(
+                    f"Docker API returned {response.status_code}: {response.text}"
+                )
+        except httpx.TimeoutException:
             docker_status = "timeout"
-            error_details.append("Docker command timed out")
+            error_details.append("Docker API request timed out")
+        except httpx.TransportError as e:
+            docker_status = "not available"
+            error_details.append(f"Cannot reach Docker daemon: {e}")
         except Exception as e:
             docker_status = f"error: {str(e)}"
             error_details.append(f"Exception: {str(e)}")
@@ -185,7 +741,7 @@ async def services() -> dict[str, Any]:
             "docker": docker_status,
             "containers": containers,
             "error_details": error_details,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
     except Exception as e:
         logger.error(f"Error getting services status: {e}")
@@ -195,317 +751,215 @@ async def services() -> dict[str, Any]:
 @app.get("/api/gpu")  # type: ignore[misc]
 async def gpu_info() -> dict[str, Any]:
     """Get GPU information"""
+    timestamp = datetime.now().isoformat()
     try:
-        # First check if nvidia-smi is available
-        result = subprocess.run(
-            ["which", "nvidia-smi"], capture_output=True, text=True, timeout=2
-        )
-        if result.returncode != 0:
+        if not gpu_monitoring_available():
             return {
                 "gpus": [],
                 "message": "nvidia-smi not available in container",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=name,memory.total,memory.used,temperature.gpu,"
-                "utilization.gpu",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            gpu_data = result.stdout.strip().split("\n")
-            gpus = []
-            for line in gpu_data:
-                if line.strip():
-                    parts = line.split(", ")
-                    if len(parts) >= 5:
-                        gpus.append(
-                            {
-                                "name": parts[0],
-                                "memory_total": parts[1],
-                                "memory_used": parts[2],
-                                "temperature": parts[3],
-                                "utilization": parts[4],
-                            }
-                        )
-            return {
-                "gpus": gpus,
-                "timestamp": datetime.now().isoformat(),
-            }
-        else:
+        samples = live_gpu_samples()
+        if not samples and (GPU_CACHE or not gpu_reader_running()):
             return {
                 "gpus": [],
                 "message": "nvidia-smi command failed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
+
+        gpus = [project_gpu(sample, GPU_INFO_PROJECTION) for sample in samples]
+        return {
+            "gpus": gpus,
+            "timestamp": timestamp,
+        }
     except Exception as e:
         logger.error(f"Error getting GPU info: {e}")
         return {
             "gpus": [],
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
 @app.get("/api/gpu/detailed")  # type: ignore[misc]
 async def gpu_detailed() -> dict[str, Any]:
     """Get detailed GPU information with processes"""
+    timestamp = datetime.now().isoformat()
     try:
-        # Get detailed GPU info
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=index,name,memory.total,memory.used,memory.free,"
-                "temperature.gpu,utilization.gpu,power.draw,power.limit,"
-                "clocks.current.graphics,clocks.current.memory",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        if not GPU_CACHE:
+            return {"error": "nvidia-smi not available"}
+        samples = live_gpu_samples()
+        if not samples:
+            return {"error": "nvidia-smi command failed"}
 
-        if result.returncode == 0:
-            gpu_data = result.stdout.strip().split("\n")
-            gpus = []
-
-            for line in gpu_data:
-                if line.strip():
-                    parts = line.split(", ")
-                    if len(parts) >= 11:
-                        gpu = {
-                            "index": parts[0],
-                            "name": parts[1],
-                            "memory_total": int(parts[2]),
-                            "memory_used": int(parts[3]),
-                            "memory_free": int(parts[4]),
-                            "memory_percent": round(
-                                (int(parts[3]) / int(parts[2])) * 100, 1
-                            ),
-                            "temperature": int(parts[5]),
-                            "utilization": int(parts[6]),
-                            "power_draw": float(parts[7]) if parts[7] != "N/A" else 0,
-                            "power_limit": float(parts[8]) if parts[8] != "N/A" else 0,
-                            "clock_graphics": int(parts[9]) if parts[9] != "N/A" else 0,
-                            "clock_memory": int(parts[10]) if parts[10] != "N/A" else 0,
-                        }
-                        gpus.append(gpu)
-
-            # Get GPU processes
-            processes = []
-            try:
-                proc_result = subprocess.run(
-                    [
-                        "nvidia-smi",
-                        "--query-compute-apps=gpu_uuid,pid,process_name,used_memory",
-                        "--format=csv,noheader,nounits",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
+        gpus = []
+        for sample in samples:
+            gpu = project_gpu(sample, GPU_DETAILED_PROJECTION)
+            gpu["memory_percent"] = _memory_percent(
+                gpu["memory_used"], gpu["memory_total"]
+            )
+            gpus.append(gpu)
 
-                if proc_result.returncode == 0:
-                    for line in proc_result.stdout.strip().split("\n"):
-                        if line.strip():
-                            parts = line.split(", ")
-                            if len(parts) >= 4:
-                                processes.append(
-                                    {
-                                        "gpu_uuid": parts[0],
-                                        "pid": parts[1],
-                                        "process_name": parts[2],
-                                        "memory_used": (
-                                            int(parts[3]) if parts[3] != "N/A" else 0
-                                        ),
-                                    }
-                                )
-            except (
-                subprocess.TimeoutExpired,
-                FileNotFoundError,
-                subprocess.CalledProcessError,
-            ):
-                pass
+        # Get GPU processes
+        processes = []
+        for parts in GPU_PROCESS_CACHE or []:
+            if len(parts) >= 4:
+                processes.append(
+                    {
+                        "gpu_uuid": parts[0],
+                        "pid": parts[1],
+                        "process_name": parts[2],
+                        "memory_used": parts[3],
+                    }
+                )
 
-            return {
-                "gpus": gpus,
-                "processes": processes,
-                "timestamp": datetime.now().isoformat(),
-            }
-        else:
-            return {"error": "nvidia-smi not available"}
+        return {
+            "gpus": gpus,
+            "processes": processes,
+            "timestamp": timestamp,
+        }
     except Exception as e:
         logger.error(f"Error getting detailed GPU info: {e}")
         return {"error": str(e)}
 
 
 @app.get("/api/gpu/realtime")  # type: ignore[misc]
-async def gpu_realtime() -> dict[str, Any]:
+async def gpu_realtime() -> Any:
     """Get real-time GPU monitoring data for charts"""
+    timestamp = datetime.now().isoformat()
     try:
-        # Get real-time GPU stats
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=index,utilization.gpu,memory.used,memory.total,"
-                "temperature.gpu,power.draw",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        if result.returncode == 0:
-            gpu_data = result.stdout.strip().split("\n")
-            realtime_data = []
-
-            for line in gpu_data:
-                if line.strip():
-                    parts = line.split(", ")
-                    if len(parts) >= 6:
-                        gpu = {
-                            "index": int(parts[0]),
-                            "utilization": int(parts[1]),
-                            "memory_used": int(parts[2]),
-                            "memory_total": int(parts[3]),
-                            "memory_percent": round(
-                                (int(parts[2]) / int(parts[3])) * 100, 1
-                            ),
-                            "temperature": int(parts[4]),
-                            "power_draw": float(parts[5]) if parts[5] != "N/A" else 0,
-                            "timestamp": datetime.now().timestamp(),
-                        }
-                        realtime_data.append(gpu)
+        if not GPU_CACHE:
+            return {"error": "nvidia-smi not available"}
+        samples = live_gpu_samples()
+        if not samples:
+            return {"error": "nvidia-smi command failed"}
 
-            return {
-                "gpus": realtime_data,
-                "timestamp": datetime.now().isoformat(),
+        # Serialize the live buffers directly, skipping jsonable_encoder copies
+        return ORJSONResponse(
+            {
+                "gpus": [GPU_REALTIME_BUFFERS[sample["index"]] for sample in samples],
+                "timestamp": timestamp,
             }
-        else:
-            return {"error": "nvidia-smi not available"}
+        )
     except Exception as e:
         logger.error(f"Error getting real-time GPU info: {e}")
         return {"error": str(e)}
 
 
+@app.get("/api/gpu/stream")  # type: ignore[misc]
+async def gpu_stream() -> Any:
+    """Push real-time GPU monitoring data to charts as Server-Sent Events"""
+
+    async def events() -> AsyncIterator[bytes]:
+        last_sample_ts = 0.0
+        while True:
+            # Push each sample once; while the samplers have nothing new,
+            # send a comment so the chart does not plot a repeated point
+            if GPU_CACHE_TS > last_sample_ts:
+                last_sample_ts = GPU_CACHE_TS
+                payload = {
+                    "gpus": [
+                        GPU_REALTIME_BUFFERS[sample["index"]]
+                        for sample in live_gpu_samples()
+                    ],
+                    "timestamp": datetime.now().isoformat(),
+                }
+                yield b"data: " + orjson.dumps(payload) + b"\n\n"
+            else:
+                yield b":\n\n"
+            await asyncio.sleep(GPU_POLL_MS / 1000)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies such as nginx from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _format_elapsed(seconds: float) -> str:
+    """Format elapsed seconds like ps etime: [[dd-]hh:]mm:ss"""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}-{hours:02d}:{minutes:02d}:{secs:02d}"
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _process_details(pid: int, now: float) -> Dict[str, Any]:
+    """Read the ps-style details of a process straight from /proc"""
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        elapsed = max(now - proc.create_time(), 1e-6)
+        cpu_times = proc.cpu_times()
+        return {
+            "user": proc.username(),
+            # Lifetime average, matching ps pcpu
+            "cpu_percent": round(
+                (cpu_times.user + cpu_times.system) / elapsed * 100, 1
+            ),
+            "memory_percent": round(proc.memory_percent(), 1),
+            "runtime": _format_elapsed(elapsed),
+            "command": " ".join(proc.cmdline()),
+        }
+
+
 @app.get("/api/gpu/processes")  # type: ignore[misc]
 async def gpu_processes() -> dict[str, Any]:
     """Get GPU processes with detailed information"""
+    timestamp = datetime.now().isoformat()
     try:
         # First check if nvidia-smi is available
-        result = subprocess.run(
-            ["which", "nvidia-smi"], capture_output=True, text=True, timeout=2
-        )
-        if result.returncode != 0:
+        if not gpu_monitoring_available():
             return {
                 "processes": [],
                 "message": "nvidia-smi not available in container",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-compute-apps=gpu_uuid,pid,process_name,used_memory,"
-                "process_type",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        if result.returncode == 0:
+        if GPU_PROCESS_CACHE is not None:
+            now = time.time()
             processes = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    parts = line.split(", ")
-                    if len(parts) >= 5:
-                        # Try to get process details
-                        process_info = {
-                            "gpu_uuid": parts[0],
-                            "pid": parts[1],
-                            "process_name": parts[2],
-                            "memory_used": int(parts[3]) if parts[3] != "N/A" else 0,
-                            "process_type": parts[4] if len(parts) > 4 else "Unknown",
-                        }
-
-                        # Try to get additional process info
-                        try:
-                            if parts[1] != "N/A":
-                                ps_result = subprocess.run(
-                                    [
-                                        "ps",
-                                        "-p",
-                                        parts[1],
-                                        "-o",
-                                        "user,pcpu,pmem,etime,command",
-                                        "--no-headers",
-                                    ],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=2,
-                                )
-
-                                if (
-                                    ps_result.returncode == 0
-                                    and ps_result.stdout.strip()
-                                ):
-                                    ps_parts = ps_result.stdout.strip().split()
-                                    if len(ps_parts) >= 4:
-                                        process_info.update(
-                                            {
-                                                "user": ps_parts[0],
-                                                "cpu_percent": (
-                                                    float(ps_parts[1])
-                                                    if ps_parts[1] != "-"
-                                                    else 0
-                                                ),
-                                                "memory_percent": (
-                                                    float(ps_parts[2])
-                                                    if ps_parts[2] != "-"
-                                                    else 0
-                                                ),
-                                                "runtime": ps_parts[3],
-                                                "command": (
-                                                    " ".join(ps_parts[4:])
-                                                    if len(ps_parts) > 4
-                                                    else ""
-                                                ),
-                                            }
-                                        )
-                        except (
-                            subprocess.TimeoutExpired,
-                            FileNotFoundError,
-                            subprocess.CalledProcessError,
-                        ):
-                            pass
-
-                        processes.append(process_info)
+            for parts in GPU_PROCESS_CACHE:
+                if len(parts) >= 5:
+                    # Try to get process details
+                    process_info = {
+                        "gpu_uuid": parts[0],
+                        "pid": parts[1],
+                        "process_name": parts[2],
+                        "memory_used": parts[3],
+                        "process_type": parts[4] if len(parts) > 4 else "Unknown",
+                    }
+
+                    # Try to get additional process info
+                    try:
+                        if parts[1] != "N/A":
+                            process_info.update(_process_details(int(parts[1]), now))
+                    except (psutil.Error, ValueError):
+                        pass
+
+                    processes.append(process_info)
 
             return {
                 "processes": processes,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
         else:
             return {
                 "processes": [],
                 "message": "No GPU processes found or nvidia-smi error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
     except Exception as e:
         logger.error(f"Error getting GPU processes: {e}")
         return {
             "processes": [],
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
@@ -518,45 +972,57 @@ async def debug_docker() -> dict[str, Any]:
         "docker_command_available": False,
         "docker_group_exists": False,
         "user_groups": [],
+        "container_cache": {
+            "hits": CONTAINER_CACHE["hits"],
+            "misses": CONTAINER_CACHE["misses"],
+        },
         "error_details": [],
     }
 
     try:
         # Check if Docker socket exists
-        import os
-
-        debug_info["docker_socket_exists"] = os.path.exists("/var/run/docker.sock")
+        debug_info["docker_socket_exists"] = os.path.exists(DOCKER_SOCKET)
 
         if debug_info["docker_socket_exists"]:
             # Check socket permissions
-            stat_info = os.stat("/var/run/docker.sock")
+            stat_info = os.stat(DOCKER_SOCKET)
             debug_info["docker_socket_permissions"] = oct(stat_info.st_mode)[-3:]
 
         # Check if docker command is available
-        result = subprocess.run(["which", "docker"], capture_output=True, text=True)
-        debug_info["docker_command_available"] = result.returncode == 0
+        debug_info["docker_command_available"] = DOCKER_BIN is not None
 
         # Check if docker group exists
-        result = subprocess.run(
-            ["getent", "group", "docker"], capture_output=True, text=True
-        )
-        debug_info["docker_group_exists"] = result.returncode == 0
+        try:
+            grp.getgrnam("docker")
+            debug_info["docker_group_exists"] = True
+        except KeyError:
+            debug_info["docker_group_exists"] = False
 
-        # Get user groups
-        result = subprocess.run(["groups"], capture_output=True, text=True)
-        if result.returncode == 0:
-            debug_info["user_groups"] = result.stdout.strip().split()
+        # Get user groups, falling back to the bare GID like `groups` does
+        user_groups = []
+        for gid in sorted({os.getegid(), *os.getgroups()}):
+            try:
+                user_groups.append(grp.getgrgid(gid).gr_name)
+            except KeyError:
+                user_groups.append(str(gid))
+        debug_info["user_groups"] = user_groups
 
-        # Try to run docker ps
-        result = subprocess.run(
-            ["docker", "ps"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            debug_info["docker_ps_success"] = True
-            debug_info["docker_ps_output"] = result.stdout.strip()
-        else:
+        # Try to list containers through the Docker API
+        assert _docker_client is not None
+        try:
+            response = await _docker_client.get("/containers/json")
+        except httpx.HTTPError as e:
             debug_info["docker_ps_success"] = False
-            debug_info["docker_ps_error"] = result.stderr.strip()
+            debug_info["docker_ps_error"] = str(e) or type(e).__name__
+        else:
+            if response.status_code == 200:
+                debug_info["docker_ps_success"] = True
+                debug_info["docker_ps_output"] = [
+                    _summarize_container(container) for container in response.json()
+                ]
+            else:
+                debug_info["docker_ps_success"] = False
+                debug_info["docker_ps_error"] = response.text.strip()
 
     except Exception as e:
         debug_info["error_details"].append(str(e))
@@ -565,4 +1031,12 @@ async def debug_docker() -> dict[str, Any]:
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -0,0 +1,253 @@
+"""Tests for the GPU sampling, parsing and formatting helpers in app.main"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+import httpx
+import pytest
+
+import app.main as main
+from app.main import (
+    GPU_FIELD_TYPES,
+    GPU_FIELDS,
+    GPU_PROCESS_FIELD_TYPES,
+    _format_elapsed,
+    _format_ports,
+    _memory_percent,
+    _parse_csv_row,
+)
+
+
+@pytest.fixture
+def gpu_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test empty GPU caches"""
+    monkeypatch.setattr(main, "GPU_CACHE", {})
+    monkeypatch.setattr(main, "GPU_SAMPLE_TS", {})
+    monkeypatch.setattr(main, "GPU_REALTIME_BUFFERS", [])
+    monkeypatch.setattr(main, "GPU_CACHE_TS", 0.0)
+
+
+def _gpu_sample(index: int, utilization: int) -> dict:
+    row = _parse_csv_row(
+        f"{index}, GPU {index}, 1000, 250, 750, 40, {utilization}, 50.0, 300.0, "
+        "1400, 1200",
+        GPU_FIELD_TYPES,
+    )
+    return dict(zip(GPU_FIELDS, row))
+
+
+def test_parse_csv_row_types_fields() -> None:
+    row = _parse_csv_row(
+        "0, NVIDIA A100, 40960, 1024, 39936, 35, 7, 55.21, 400.00, 1410, 1215",
+        GPU_FIELD_TYPES,
+    )
+    assert row == [
+        0,
+        "NVIDIA A100",
+        40960,
+        1024,
+        39936,
+        35,
+        7,
+        55.21,
+        400.0,
+        1410,
+        1215,
+    ]
+
+
+def test_parse_csv_row_numeric_na_reads_as_zero() -> None:
+    row = _parse_csv_row(
+        "1, Tesla T4, [N/A], 0, 0, 40, [Not Supported], N/A, [N/A], 300, 5000",
+        GPU_FIELD_TYPES,
+    )
+    assert row == [1, "Tesla T4", 0, 0, 0, 40, 0, 0, 0, 300, 5000]
+
+
+def test_parse_csv_row_keeps_na_in_string_fields() -> None:
+    row = _parse_csv_row("GPU-1234, 4242, [N/A], 512, C", GPU_PROCESS_FIELD_TYPES)
+    assert row == ["GPU-1234", "4242", "[N/A]", 512, "C"]
+
+
+def test_parse_csv_row_error_placeholders_read_as_zero() -> None:
+    row = _parse_csv_row(
+        "0, [GPU is lost], [Unknown Error], [Insufficient Permissions], 0, 0, 0, "
+        "0, 0, 0, 0",
+        GPU_FIELD_TYPES,
+    )
+    assert row == [0, "[GPU is lost]", 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def test_parse_csv_row_short_row_is_truncated() -> None:
+    row = _parse_csv_row("0, NVIDIA A100, 40960", GPU_FIELD_TYPES)
+    assert row == [0, "NVIDIA A100", 40960]
+    assert len(row) != len(GPU_FIELDS)
+
+
+def test_memory_percent_zero_total() -> None:
+    assert _memory_percent(1024, 0) == 0.0
+    assert _memory_percent(1024, 4096) == 25.0
+
+
+@pytest.mark.usefixtures("gpu_state")
+def test_live_gpu_samples_drops_gpus_that_stop_reporting() -> None:
+    now = time.time()
+    main._store_gpu_sample(_gpu_sample(0, 10), now)
+    main._store_gpu_sample(_gpu_sample(1, 99), now - main.GPU_STALE_SECONDS - 1)
+    assert [sample["index"] for sample in main.live_gpu_samples()] == [0]
+    assert main.GPU_REALTIME_BUFFERS[0]["utilization"] == 10
+
+
+class FakeNVMLError(Exception):
+    pass
+
+
+def _fake_pynvml(lost: set) -> SimpleNamespace:
+    """A two-GPU NVML stand-in whose GPUs in `lost` fail every query"""
+
+    def handle(i: int) -> int:
+        if i in lost:
+            raise FakeNVMLError("GPU is lost")
+        return i
+
+    def utilization(h: int) -> Any:
+        if h == 0:
+            raise FakeNVMLError("Not Supported")
+        return SimpleNamespace(gpu=99)
+
+    return SimpleNamespace(
+        NVMLError=FakeNVMLError,
+        NVML_TEMPERATURE_GPU=0,
+        NVML_CLOCK_GRAPHICS=0,
+        NVML_CLOCK_MEM=2,
+        nvmlDeviceGetCount=lambda: 2,
+        nvmlDeviceGetHandleByIndex=handle,
+        nvmlDeviceGetName=lambda h: b"Fake GPU",
+        nvmlDeviceGetMemoryInfo=lambda h: SimpleNamespace(
+            total=1024 * 2**20, used=256 * 2**20, free=768 * 2**20
+        ),
+        nvmlDeviceGetUtilizationRates=utilization,
+        nvmlDeviceGetTemperature=lambda h, sensor: 40,
+        nvmlDeviceGetPowerUsage=lambda h: 50000,
+        nvmlDeviceGetEnforcedPowerLimit=lambda h: 300000,
+        nvmlDeviceGetClockInfo=lambda h, clock: 1400,
+        nvmlDeviceGetUUID=lambda h: f"GPU-{h}".encode(),
+        nvmlDeviceGetComputeRunningProcesses=lambda h: [
+            SimpleNamespace(pid=100 + h, usedGpuMemory=512 * 2**20)
+        ],
+        nvmlSystemGetProcessName=lambda pid: b"python",
+    )
+
+
+@pytest.mark.usefixtures("gpu_state")
+def test_nvml_sweep_drops_gpus_it_cannot_read(monkeypatch: pytest.MonkeyPatch) -> None:
+    lost: set = set()
+    monkeypatch.setattr(main, "pynvml", _fake_pynvml(lost))
+    main._sample_nvml_stats()
+    # Unsupported utilization reads as 0 without hiding the GPU
+    assert main.GPU_CACHE[0]["utilization.gpu"] == 0
+    assert main.GPU_CACHE[1]["utilization.gpu"] == 99
+
+    lost.add(1)
+    main._sample_nvml_stats()
+    assert list(main.GPU_CACHE) == [0]
+    assert [sample["index"] for sample in main.live_gpu_samples()] == [0]
+
+
+def test_nvml_processes_skip_gpus_it_cannot_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(main, "pynvml", _fake_pynvml({0}))
+    assert main._sample_nvml_processes() == [["GPU-1", "101", "python", 512, "C"]]
+
+
+@pytest.fixture
+def docker_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> None:
+    """Point the app at a stand-in Docker socket with an empty container cache"""
+    socket = tmp_path / "docker.sock"
+    socket.touch()
+    monkeypatch.setattr(main, "DOCKER_SOCKET", str(socket))
+    monkeypatch.setattr(
+        main,
+        "CONTAINER_CACHE",
+        {"containers": [], "ts": 0.0, "dirty": True, "hits": 0, "misses": 0},
+    )
+
+
+@pytest.mark.usefixtures("docker_state")
+def test_services_container_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: List[str] = []
+    container = {"Names": ["/web"], "Status": "Up 1 minute", "Ports": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=[container])
+
+    async def scenario() -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://docker"
+        ) as client:
+            monkeypatch.setattr(main, "_docker_client", client)
+            # Starts dirty, so the first request asks the daemon
+            first = await main.services()
+            assert first["containers"] == [
+                {"name": "web", "status": "Up 1 minute", "ports": ""}
+            ]
+            assert len(requests) == 1
+            # Clean and within the TTL: served from the cache
+            assert (await main.services())["containers"] == first["containers"]
+            assert len(requests) == 1
+            # A container event marks the cache dirty
+            main.CONTAINER_CACHE["dirty"] = True
+            await main.services()
+            assert len(requests) == 2
+            # So does outliving the TTL
+            main.CONTAINER_CACHE["ts"] -= main.CONTAINER_CACHE_TTL_SECONDS
+            await main.services()
+            assert len(requests) == 3
+
+    asyncio.run(scenario())
+    assert main.CONTAINER_CACHE["hits"] == 1
+    assert main.CONTAINER_CACHE["misses"] == 3
+
+
+@pytest.mark.usefixtures("docker_state")
+def test_services_refetches_after_a_failed_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    responses = [httpx.Response(500, text="boom"), httpx.Response(200, json=[])]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async def scenario() -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://docker"
+        ) as client:
+            monkeypatch.setattr(main, "_docker_client", client)
+            assert (await main.services())["docker"] == "not running"
+            assert (await main.services())["docker"] == "running"
+
+    asyncio.run(scenario())
+    assert not responses
+
+
+def test_format_ports() -> None:
+    ports = [
+        {"IP": "0.0.0.0", "PrivatePort": 8080, "PublicPort": 8080, "Type": "tcp"},
+        {"PrivatePort": 3000, "Type": "tcp"},
+    ]
+    assert _format_ports(ports) == "0.0.0.0:8080->8080/tcp, 3000/tcp"
+
+
+def test_format_ports_empty() -> None:
+    assert _format_ports([]) == ""
+
+
+def test_format_elapsed() -> None:
+    assert _format_elapsed(5) == "00:05"
+    assert _format_elapsed(3 * 60 + 7.9) == "03:07"
+    assert _format_elapsed(2 * 3600 + 61) == "02:01:01"
+    assert _format_elapsed(3 * 86400 + 4 * 3600 + 5 * 60 + 6) == "3-04:05:06"